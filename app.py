@@ -6,10 +6,12 @@ from PyPDF2 import PdfReader
 import google.generativeai as genai
 import time
 import fitz
-import docx
 from datetime import datetime
 import io
 import re
+import posixpath
+import zipfile
+import xml.etree.ElementTree as ET
 from reportlab.platypus import SimpleDocTemplate, Paragraph
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -18,6 +20,141 @@ from reportlab.lib.enums import TA_JUSTIFY
 # Configure Gemini AI
 genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
 
+class DocxExtractor:
+    """Stream text out of a DOCX zip, including tables, headers/footers and text boxes."""
+
+    W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+    R_ID = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+    RELATIONSHIP = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+    MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+    DOCUMENT = "word/document.xml"
+    DOCUMENT_RELS = "word/_rels/document.xml.rels"
+
+    @staticmethod
+    def iterparse(stream):
+        # Yields (event, elem, parent) and drops each finished element from its
+        # parent once the caller has handled its end event, so the tree never grows
+        elements = []
+        for event, elem in ET.iterparse(stream, events=("start", "end")):
+            if event == "start":
+                yield event, elem, elements[-1] if elements else None
+                elements.append(elem)
+                continue
+            elements.pop()
+            parent = elements[-1] if elements else None
+            yield event, elem, parent
+            elem.clear()
+            if parent is not None:
+                parent.remove(elem)
+
+    @classmethod
+    def relationship_targets(cls, zf):
+        if cls.DOCUMENT_RELS not in zf.namelist():
+            return {}
+        targets = {}
+        with zf.open(cls.DOCUMENT_RELS) as rels:
+            for rel in ET.parse(rels).getroot().iter(cls.RELATIONSHIP):
+                if rel.get("TargetMode") == "External":
+                    continue
+                target = rel.get("Target", "")
+                target = target.lstrip("/") if target.startswith("/") else "word/" + target
+                targets[rel.get("Id")] = posixpath.normpath(target)
+        return targets
+
+    @classmethod
+    def iter_part_lines(cls, stream, header_ids=None, footer_ids=None):
+        W = cls.W
+        paras, rows, cells, ready = [], [], [], []
+        skip = 0
+
+        def emit(line):
+            if cells:
+                cells[-1].append(line)
+            else:
+                ready.append(line)
+
+        for event, elem, parent in cls.iterparse(stream):
+            tag = elem.tag
+            if event == "start":
+                if tag == cls.MC_FALLBACK:
+                    # mc:Fallback repeats the text box content of mc:Choice (VML copy)
+                    skip += 1
+                elif skip:
+                    continue
+                elif tag == W + "p":
+                    paras.append([])
+                elif tag == W + "tr":
+                    rows.append([])
+                elif tag == W + "tc":
+                    cells.append([])
+                continue
+
+            in_run = parent is not None and parent.tag == W + "r"
+            if tag == cls.MC_FALLBACK:
+                skip -= 1
+            elif skip:
+                pass
+            elif tag == W + "t":
+                if paras and elem.text:
+                    paras[-1].append(elem.text)
+            elif tag == W + "tab":
+                # w:tab also defines tab stops under w:pPr/w:tabs; only runs hold text
+                if paras and in_run:
+                    paras[-1].append("\t")
+            elif tag in (W + "br", W + "cr"):
+                if paras and in_run:
+                    paras[-1].append("\n")
+            elif tag == W + "p":
+                emit("".join(paras.pop()))
+            elif tag == W + "tc":
+                cell = " ".join(line.strip() for line in cells.pop() if line.strip())
+                if rows:
+                    rows[-1].append(cell)
+            elif tag == W + "tr":
+                row = rows.pop()
+                if any(row):
+                    emit("\t".join(row))
+            elif tag == W + "headerReference" and header_ids is not None:
+                header_ids.append(elem.get(cls.R_ID))
+            elif tag == W + "footerReference" and footer_ids is not None:
+                footer_ids.append(elem.get(cls.R_ID))
+
+            while ready:
+                yield ready.pop(0)
+
+    @classmethod
+    def unique_part_lines(cls, zf, ids, targets, seen):
+        # Only referenced parts are read, and a part repeating one already emitted
+        # (e.g. a first-page header matching the default one) is skipped
+        lines = []
+        names = set(zf.namelist())
+        for name in dict.fromkeys(targets.get(rid) for rid in ids):
+            if name not in names:
+                continue
+            with zf.open(name) as part:
+                part_lines = tuple(cls.iter_part_lines(part))
+            if part_lines and part_lines not in seen:
+                seen.add(part_lines)
+                lines.extend(part_lines)
+        return lines
+
+    @classmethod
+    def extract_text(cls, f):
+        with zipfile.ZipFile(f) as zf:
+            if cls.DOCUMENT not in zf.namelist():
+                return ""
+            # Header/footer references sit in w:sectPr, usually at the end of the
+            # body, so they are collected in the same pass and the header text is
+            # put in front afterwards
+            header_ids, footer_ids = [], []
+            with zf.open(cls.DOCUMENT) as document:
+                body = list(cls.iter_part_lines(document, header_ids, footer_ids))
+            targets = cls.relationship_targets(zf)
+            seen = set()
+            headers = cls.unique_part_lines(zf, header_ids, targets, seen)
+            footers = cls.unique_part_lines(zf, footer_ids, targets, seen)
+        return "\n".join(headers + body + footers)
+
 class ATSAnalyzer:
     @staticmethod
     def get_gemini_response(input_prompt, pdf_text, job_description):
@@ -41,6 +178,21 @@ class ATSAnalyzer:
             st.error(f"Error extracting PDF text: {str(e)}")
             return None
 
+    @staticmethod
+    def extract_text_from_docx(uploaded_file):
+        try:
+            text = DocxExtractor.extract_text(uploaded_file)
+            return text if text.strip() else None
+        except Exception as e:
+            st.error(f"Error extracting DOCX text: {str(e)}")
+            return None
+
+    @staticmethod
+    def extract_text(uploaded_file):
+        if uploaded_file.type.startswith("application/vnd.openxmlformats"):
+            return ATSAnalyzer.extract_text_from_docx(uploaded_file)
+        return ATSAnalyzer.extract_text_from_pdf(uploaded_file)
+
 class CVImprover:
     def __init__(self):
         self.model = genai.GenerativeModel('gemini-2.0-flash-exp')
@@ -57,6 +209,19 @@ class CVImprover:
             st.error(f"Error extracting PDF text: {str(e)}")
             return None
 
+    def extract_text_from_docx(self, docx_file):
+        try:
+            text = DocxExtractor.extract_text(docx_file)
+            return text if text.strip() else None
+        except Exception as e:
+            st.error(f"Error extracting DOCX text: {str(e)}")
+            return None
+
+    def extract_text(self, cv_file):
+        if cv_file.type.startswith("application/vnd.openxmlformats"):
+            return self.extract_text_from_docx(cv_file)
+        return self.extract_text_from_pdf(cv_file)
+
     def improve_cv_general(self, cv_text):
         if not cv_text or cv_text.strip() == "":
             return "Error: No CV text provided or CV text is empty."
@@ -165,8 +330,7 @@ class CoverLetterGenerator:
 
     def extract_text_from_docx(self, f):
         try:
-            doc = docx.Document(f)
-            return "\n".join(p.text for p in doc.paragraphs)
+            return DocxExtractor.extract_text(f)
         except Exception as e:
             st.error(f"Error extracting DOCX text: {str(e)}")
             return ""
@@ -321,13 +485,13 @@ def resume_analyzer_page():
     with col2:
         st.subheader("📎 Resume Upload")
         uploaded_file = st.file_uploader(
-            "Upload your resume (PDF format)",
-            type=["pdf"],
-            help="Please ensure your resume is in PDF format"
+            "Upload your resume (PDF or DOCX format)",
+            type=["pdf", "docx"],
+            help="Please ensure your resume is in PDF or DOCX format"
         )
 
         if uploaded_file:
-            st.markdown('<p class="success-message">✅ PDF uploaded successfully!</p>', unsafe_allow_html=True)
+            st.markdown('<p class="success-message">✅ Resume uploaded successfully!</p>', unsafe_allow_html=True)
 
     # Analysis options
     if uploaded_file and job_description:
@@ -339,10 +503,10 @@ def resume_analyzer_page():
 
         if st.button("Analyze Resume"):
             with st.spinner("Analyzing your resume... Please wait"):
-                # Extract PDF text
-                pdf_text = ATSAnalyzer.extract_text_from_pdf(uploaded_file)
+                # Extract resume text
+                resume_text = ATSAnalyzer.extract_text(uploaded_file)
                 
-                if pdf_text:
+                if resume_text:
                     # Select prompt based on analysis type
                     if analysis_type == "Detailed Resume Review":
                         prompt = """
@@ -369,7 +533,7 @@ def resume_analyzer_page():
                         """
 
                     # Get and display response
-                    response = ATSAnalyzer.get_gemini_response(prompt, pdf_text, job_description)
+                    response = ATSAnalyzer.get_gemini_response(prompt, resume_text, job_description)
                     
                     if response:
                         st.markdown("### Analysis Results")
@@ -385,7 +549,7 @@ def resume_analyzer_page():
                     else:
                         st.error("❌ Failed to generate analysis. Please try again.")
                 else:
-                    st.error("❌ Failed to extract text from PDF. Please ensure your PDF is readable.")
+                    st.error("❌ Failed to extract text from your resume. Please ensure the file is readable.")
     else:
         st.info("👆 Please upload your resume and provide the job description to begin the analysis.")
 
@@ -436,18 +600,18 @@ def cv_improver_page():
     cv_improver = CVImprover()
 
     st.subheader("📎 Upload your CV")
-    pdf_file = st.file_uploader(
-        "Choose a PDF file", 
-        type="pdf", 
+    cv_file = st.file_uploader(
+        "Choose a PDF or DOCX file", 
+        type=["pdf", "docx"], 
         key="cv_improver_upload",
-        help="Please ensure your CV is in PDF format for best results"
+        help="Please ensure your CV is in PDF or DOCX format for best results"
     )
 
-    if pdf_file is not None:
-        st.markdown('<p class="success-message">✅ PDF uploaded successfully!</p>', unsafe_allow_html=True)
+    if cv_file is not None:
+        st.markdown('<p class="success-message">✅ CV uploaded successfully!</p>', unsafe_allow_html=True)
         
-        with st.spinner("Extracting text from PDF..."):
-            cv_text = cv_improver.extract_text_from_pdf(pdf_file)
+        with st.spinner("Extracting text from CV..."):
+            cv_text = cv_improver.extract_text(cv_file)
 
         if cv_text:
             # Show extracted text preview
@@ -526,16 +690,16 @@ def cv_improver_page():
                     else:
                         st.markdown('<p class="warning-message">⚠️ Please provide both job description and minimum qualifications.</p>', unsafe_allow_html=True)
         else:
-            st.error("❌ Failed to extract text from the PDF. Please ensure your PDF is readable and try again.")
+            st.error("❌ Failed to extract text from the CV. Please ensure your file is readable and try again.")
     else:
-        st.info("👆 Please upload your CV in PDF format to begin the improvement process.")
+        st.info("👆 Please upload your CV in PDF or DOCX format to begin the improvement process.")
 
     # Additional tips section
     with st.expander("💡 Tips for Best Results"):
         st.markdown("""
         **To get the best CV improvements:**
         
-        1. **PDF Quality**: Ensure your PDF is text-based (not scanned images)
+        1. **File Quality**: Ensure your PDF is text-based (not scanned images) or upload the original DOCX
         2. **Complete Information**: Include all sections (contact, experience, education, skills)
         3. **Job-Specific Mode**: Provide detailed job descriptions for better tailoring
         4. **Review Output**: Always review and customize the AI suggestions to match your voice
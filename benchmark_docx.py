@@ -0,0 +1,155 @@
+"""Compare DocxExtractor against python-docx on large generated documents.
+
+Both extractors read body paragraphs, tables, headers and footers, and must
+return the same lines. Each run happens in a fresh subprocess that reports its
+own VmHWM, which resets at exec, so the parent's memory is not counted.
+
+Usage: python benchmark_docx.py [paragraphs ...]
+"""
+import hashlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+
+import docx
+
+from app import DocxExtractor
+
+
+def build_docx(paragraphs, path):
+    document = docx.Document()
+    document.sections[0].header.paragraphs[0].text = "Jane Doe | jane.doe@example.com"
+    document.sections[0].footer.paragraphs[0].text = "References available on request"
+    for i in range(paragraphs):
+        document.add_paragraph(f"Led project {i}, improving delivery time by {i % 50}% across three teams.")
+        if i % 100 == 0:
+            table = document.add_table(rows=3, cols=2)
+            for row in table.rows:
+                row.cells[0].text = "Skill"
+                row.cells[1].text = "Python, SQL, Data Analysis"
+    document.save(path)
+
+
+def python_docx_text(data):
+    doc = docx.Document(io.BytesIO(data))
+    lines = []
+    for section in doc.sections:
+        lines.extend(p.text for p in section.header.paragraphs)
+    lines.extend(p.text for p in doc.paragraphs)
+    for table in doc.tables:
+        for row in table.rows:
+            lines.append("\t".join(cell.text for cell in row.cells))
+    for section in doc.sections:
+        lines.extend(p.text for p in section.footer.paragraphs)
+    return "\n".join(lines)
+
+
+def streaming_text(data):
+    return DocxExtractor.extract_text(io.BytesIO(data))
+
+
+EXTRACTORS = {"python-docx": python_docx_text, "streaming": streaming_text}
+
+
+NAMESPACES = (
+    'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+    'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+)
+
+SAMPLE_DOCUMENT = f"""<w:document {NAMESPACES}><w:body>
+<w:p><w:pPr><w:tabs><w:tab w:val="left" w:pos="720"/><w:tab w:val="right" w:pos="9000"/></w:tabs></w:pPr>
+<w:r><w:t>Engineer</w:t></w:r><w:r><w:tab/><w:t>2020</w:t></w:r></w:p>
+<w:tbl><w:tr><w:tc><w:p><w:r><w:t>Skills</w:t></w:r></w:p></w:tc>
+<w:tc><w:p><w:r><w:t>Python</w:t></w:r></w:p><w:p><w:r><w:t>SQL</w:t></w:r></w:p></w:tc></w:tr></w:tbl>
+<w:p><w:r><mc:AlternateContent>
+<mc:Choice><w:drawing><w:txbxContent><w:p><w:r><w:t>Certified Analyst</w:t></w:r></w:p></w:txbxContent></w:drawing></mc:Choice>
+<mc:Fallback><w:pict><w:txbxContent><w:p><w:r><w:t>Certified Analyst</w:t></w:r></w:p></w:txbxContent></w:pict></mc:Fallback>
+</mc:AlternateContent></w:r><w:r><w:t>Awards</w:t></w:r></w:p>
+<w:sectPr><w:headerReference w:type="default" r:id="rId1"/><w:headerReference w:type="first" r:id="rId2"/>
+<w:footerReference w:type="default" r:id="rId3"/></w:sectPr>
+</w:body></w:document>"""
+
+SAMPLE_RELS = """<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Target="header1.xml"/><Relationship Id="rId2" Target="header2.xml"/>
+<Relationship Id="rId3" Target="footer1.xml"/></Relationships>"""
+
+
+def sample_part(root, text):
+    return f"<w:{root} {NAMESPACES}><w:p><w:r><w:t>{text}</w:t></w:r></w:p></w:{root}>"
+
+
+def check_extractor():
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        zf.writestr("word/document.xml", SAMPLE_DOCUMENT)
+        zf.writestr("word/_rels/document.xml.rels", SAMPLE_RELS)
+        zf.writestr("word/header1.xml", sample_part("hdr", "Jane Doe"))
+        zf.writestr("word/header2.xml", sample_part("hdr", "Jane Doe"))
+        zf.writestr("word/header3.xml", sample_part("hdr", "Unreferenced"))
+        zf.writestr("word/footer1.xml", sample_part("ftr", "Page"))
+    buffer.seek(0)
+    lines = DocxExtractor.extract_text(buffer).split("\n")
+    expected = ["Jane Doe", "Engineer\t2020", "Skills\tPython SQL", "Certified Analyst", "Awards", "Page"]
+    assert lines == expected, lines
+
+
+def peak_rss_mib():
+    # VmHWM is this process's own high-water mark; ru_maxrss would carry over
+    # the parent's across exec on Linux
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 2**10
+    raise RuntimeError("VmHWM not available; this benchmark needs Linux /proc")
+
+
+def run_one(name, path):
+    with open(path, "rb") as f:
+        data = f.read()
+    baseline = peak_rss_mib()
+    start = time.perf_counter()
+    text = EXTRACTORS[name](data)
+    elapsed = time.perf_counter() - start
+    peak = peak_rss_mib()
+    lines = sorted(line for line in text.split("\n") if line.strip())
+    print(elapsed, peak, peak - baseline, len(text))
+    print(hashlib.sha256("\n".join(lines).encode()).hexdigest())
+
+
+def measure(name, path):
+    result = subprocess.run(
+        [sys.executable, __file__, "--run", name, path],
+        check=True, capture_output=True, text=True,
+    )
+    stats, digest = result.stdout.splitlines()[-2:]
+    elapsed, peak, growth, chars = stats.split()
+    return float(elapsed), float(peak), float(growth), int(chars), digest
+
+
+def main():
+    if sys.argv[1:2] == ["--run"]:
+        run_one(sys.argv[2], sys.argv[3])
+        return
+
+    check_extractor()
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1000, 10000, 50000]
+    print(f"{'paragraphs':>10} {'extractor':>12} {'seconds':>9} {'peak MiB':>9} {'growth MiB':>11} {'chars':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            path = os.path.join(tmp, f"cv_{size}.docx")
+            build_docx(size, path)
+            digests = set()
+            for name in EXTRACTORS:
+                elapsed, peak, growth, chars, digest = measure(name, path)
+                digests.add(digest)
+                print(f"{size:>10} {name:>12} {elapsed:>9.3f} {peak:>9.1f} {growth:>11.1f} {chars:>10}")
+            assert len(digests) == 1, f"extractors returned different lines for {size} paragraphs"
+
+
+if __name__ == "__main__":
+    main()